@@ -2,31 +2,38 @@
 Test for Django admin modifications
 """
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.test import Client
 
 
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+)
 class AdminSiteTests(TestCase):
     """Tests for Django admin."""
 
-    def setUp(self):
-        """Create user and client."""
+    @classmethod
+    def setUpTestData(cls):
+        """Create users."""
 
-        self.client = Client()
-        self.admin_user = get_user_model().objects.create_superuser(
+        cls.admin_user = get_user_model().objects.create_superuser(
             email="admin@example.com",
             password="testpass123"
         )
-
-        self.client.force_login(self.admin_user)
-        self.user = get_user_model().objects.create_user(
+        cls.user = get_user_model().objects.create_user(
             email="user@example.com",
             password="testpass123",
             name="Test User"
         )
 
+    def setUp(self):
+        """Create client."""
+
+        self.client = Client()
+        self.client.force_login(self.admin_user)
+
     def test_users_list(self):
         """Test that users are listed on page."""
         url = reverse('admin:core_user_changelist')
@@ -4,7 +4,7 @@ Tests for models.
 from unittest.mock import patch
 from decimal import Decimal
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 
 from core import models
@@ -15,6 +15,9 @@ def create_user(email='email@example.com', password='testpass123'):
     return get_user_model().objects.create_user(email, password)
 
 
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+)
 class ModelTest(TestCase):
     """Test models"""
 
@@ -7,18 +7,37 @@ from django.urls import reverse
 from django.test import TestCase
 
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import (
+    APIClient,
+    APIRequestFactory,
+    force_authenticate,
+)
 
 from core.models import Ingredient, Recipe
 
 from recipe.serializers import IngredientSerializer
+from recipe.views import IngredientViewSet
 
 INGREDIENTS_URL = reverse('recipe:ingredient-list')
+INGREDIENT_DETAIL_PREFIX = reverse(
+    'recipe:ingredient-detail', args=[0]
+).rsplit('/', 2)[0]
 
 
 def detail_url(ingredient_id):
     """Return a url for ingredient details."""
-    return reverse('recipe:ingredient-detail', args=[ingredient_id])
+    return f'{INGREDIENT_DETAIL_PREFIX}/{ingredient_id}/'
+
+
+ingredient_list_view = IngredientViewSet.as_view({'get': 'list'})
+
+
+def list_ingredients(user, params=None):
+    """Call the ingredient list view directly and return the response."""
+    request = APIRequestFactory().get(INGREDIENTS_URL, params)
+    force_authenticate(request, user=user)
+
+    return ingredient_list_view(request)
 
 
 def create_user(email='user@example.com', password='testpass123'):
@@ -44,23 +63,31 @@ class PublicIngredientsApiTests(TestCase):
 class PrivateIngredientsApiTests(TestCase):
     """Test authenticated API requests."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
     def setUp(self):
-        self.user = create_user()
         self.client = APIClient()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_ingredients(self):
         """Test retrieving a list of ingredients."""
-        Ingredient.objects.create(user=self.user, name="Vinegar")
-        Ingredient.objects.create(user=self.user, name="Tomatoes")
+        vinegar, tomatoes = Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name="Vinegar"),
+            Ingredient(user=self.user, name="Tomatoes"),
+        ])
 
-        res = self.client.get(INGREDIENTS_URL)
+        with self.assertNumQueries(1):
+            res = self.client.get(INGREDIENTS_URL)
 
-        ingredients = Ingredient.objects.all().order_by('-name')
-        serializer = IngredientSerializer(ingredients, many=True)
+        expected = [
+            {'id': vinegar.id, 'name': vinegar.name},
+            {'id': tomatoes.id, 'name': tomatoes.name},
+        ]
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data, expected)
 
     def test_ingredients_limited_to_user(self):
         """Test list of ingredients limited to authenticated user."""
@@ -68,7 +95,8 @@ class PrivateIngredientsApiTests(TestCase):
         Ingredient.objects.create(user=user2, name="Chilli")
         ingredient = Ingredient.objects.create(user=self.user, name="Chicken")
 
-        res = self.client.get(INGREDIENTS_URL)
+        with self.assertNumQueries(1):
+            res = list_ingredients(self.user)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(len(res.data), 1)
@@ -100,17 +128,22 @@ class PrivateIngredientsApiTests(TestCase):
 
     def test_filter_ingredients_assigned_to_recipes(self):
         """Test restricting ingredients to those assigned to recipes."""
-        in1 = Ingredient.objects.create(user=self.user, name="Red Pepper")
-        in2 = Ingredient.objects.create(user=self.user, name="Green Pepper")
+        in1, in2 = Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name="Red Pepper"),
+            Ingredient(user=self.user, name="Green Pepper"),
+        ])
         recipe = Recipe.objects.create(
             title='Stir Fry',
-            cost=Decimal(6.2),
+            cost=Decimal('6.2'),
             time_minutes=10,
             user=self.user
         )
-        recipe.ingredients.add(in1)
+        Recipe.ingredients.through.objects.create(
+            recipe=recipe, ingredient=in1
+        )
 
-        res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
+        with self.assertNumQueries(1):
+            res = list_ingredients(self.user, {'assigned_only': 1})
         s1 = IngredientSerializer(in1)
         s2 = IngredientSerializer(in2)
         self.assertIn(s1.data, res.data)
@@ -119,21 +152,27 @@ class PrivateIngredientsApiTests(TestCase):
     def test_filtered_ingredients_unique(self):
         """Test filtered ingredients returns a unique list."""
         in1 = Ingredient.objects.create(user=self.user, name="Eggs")
-        r1 = Recipe.objects.create(
-            title="Ham and Eggs",
-            cost=Decimal(5.1),
-            time_minutes=5,
-            user=self.user
-        )
-        r1.ingredients.add(in1)
-        r2 = Recipe.objects.create(
-            title="Eggs Florentine",
-            cost=Decimal(10.9),
-            time_minutes=15,
-            user=self.user
-        )
-        r2.ingredients.add(in1)
-
-        res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
+        r1, r2 = Recipe.objects.bulk_create([
+            Recipe(
+                title="Ham and Eggs",
+                cost=Decimal('5.1'),
+                time_minutes=5,
+                user=self.user
+            ),
+            Recipe(
+                title="Eggs Florentine",
+                cost=Decimal('10.9'),
+                time_minutes=15,
+                user=self.user
+            ),
+        ])
+        RecipeIngredient = Recipe.ingredients.through
+        RecipeIngredient.objects.bulk_create([
+            RecipeIngredient(recipe=r1, ingredient=in1),
+            RecipeIngredient(recipe=r2, ingredient=in1),
+        ])
+
+        with self.assertNumQueries(1):
+            res = list_ingredients(self.user, {'assigned_only': 1})
 
         self.assertEqual(len(res.data), 1)
@@ -10,7 +10,7 @@ from PIL import Image
 from decimal import Decimal
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
 
@@ -76,15 +76,21 @@ class PublicRecipeApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+)
 class PrivateRecipeApiTests(TestCase):
     """Test authenticated API requests"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email="user@example.com",
             password="testpass123",
         )
+
+    def setUp(self):
+        self.client = APIClient()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_recipes(self):
@@ -460,15 +466,21 @@ class PrivateRecipeApiTests(TestCase):
         self.assertNotIn(s3.data, res.data)
 
 
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+)
 class ImageUploadTests(TestCase):
     """Test for the image upload API."""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             'user@example.com',
             'password123'
         )
+
+    def setUp(self):
+        self.client = APIClient()
         self.client.force_authenticate(self.user)
         self.recipe = create_recipe(user=self.user)
 
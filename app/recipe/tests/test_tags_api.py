@@ -9,18 +9,35 @@ from django.test import TestCase
 from django.urls import reverse
 
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import (
+    APIClient,
+    APIRequestFactory,
+    force_authenticate,
+)
 
 from recipe.serializers import TagSerializer
+from recipe.views import TagViewSet
 
 from core.models import Tag, Recipe
 
 TAGS_URL = reverse("recipe:tag-list")
+TAG_DETAIL_PREFIX = reverse('recipe:tag-detail', args=[0]).rsplit('/', 2)[0]
 
 
 def detail_url(tag_id):
     """Create and return a detail tag url."""
-    return reverse('recipe:tag-detail', args=[tag_id])
+    return f'{TAG_DETAIL_PREFIX}/{tag_id}/'
+
+
+tag_list_view = TagViewSet.as_view({'get': 'list'})
+
+
+def list_tags(user, params=None):
+    """Call the tag list view directly and return the response."""
+    request = APIRequestFactory().get(TAGS_URL, params)
+    force_authenticate(request, user=user)
+
+    return tag_list_view(request)
 
 
 def create_user(email='email@example.com', password='testpass123'):
@@ -53,23 +70,31 @@ class PublicTagsApiTests(TestCase):
 class PrivateTagsApiTests(TestCase):
     """Test authenticated API requests"""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
     def setUp(self):
-        self.user = create_user()
         self.client = APIClient()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_tags(self):
         """ Test retrieving list of tags. """
-        create_tag(self.user, name="Italian")
-        create_tag(self.user, name="Greek")
+        italian, greek = Tag.objects.bulk_create([
+            Tag(user=self.user, name="Italian"),
+            Tag(user=self.user, name="Greek"),
+        ])
 
-        res = self.client.get(TAGS_URL)
+        with self.assertNumQueries(1):
+            res = self.client.get(TAGS_URL)
 
-        tags = Tag.objects.all().order_by('-name')
-        serializer = TagSerializer(tags, many=True)
+        expected = [
+            {'id': italian.id, 'name': italian.name},
+            {'id': greek.id, 'name': greek.name},
+        ]
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data, expected)
 
     def test_tags_limited_to_user(self):
         """List of tags is limited to user's tags."""
@@ -77,9 +102,8 @@ class PrivateTagsApiTests(TestCase):
         tag = create_tag(self.user, name="Italian")
         create_tag(other_user, name="Greek")
 
-        res = self.client.get(TAGS_URL)
-
-        Tag.objects.all().order_by('-name')
+        with self.assertNumQueries(1):
+            res = list_tags(self.user)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(len(res.data), 1)
@@ -115,41 +139,50 @@ class PrivateTagsApiTests(TestCase):
 
     def test_filter_tagss_assigned_to_recipes(self):
         """Test restricting ingredients to those assigned to recipes."""
-        tag1 = Tag.objects.create(user=self.user, name="Dinner")
-        tag2 = Tag.objects.create(user=self.user, name="Lunch")
+        tag1, tag2 = Tag.objects.bulk_create([
+            Tag(user=self.user, name="Dinner"),
+            Tag(user=self.user, name="Lunch"),
+        ])
 
         recipe = Recipe.objects.create(
             title='Stir Fry',
-            cost=Decimal(6.2),
+            cost=Decimal('6.2'),
             time_minutes=10,
             user=self.user
         )
-        recipe.tags.add(tag1)
+        Recipe.tags.through.objects.create(recipe=recipe, tag=tag1)
 
-        res = self.client.get(TAGS_URL, {'assigned_only': 1})
+        with self.assertNumQueries(1):
+            res = list_tags(self.user, {'assigned_only': 1})
         s1 = TagSerializer(tag1)
         s2 = TagSerializer(tag2)
         self.assertIn(s1.data, res.data)
         self.assertNotIn(s2.data, res.data)
 
-    def test_filtered_ingredients_unique(self):
-        """Test filtered ingredients returns a unique list."""
+    def test_filtered_tags_unique(self):
+        """Test filtered tags returns a unique list."""
         tag1 = Tag.objects.create(user=self.user, name="Breakfast")
-        r1 = Recipe.objects.create(
-            title="Ham and Eggs",
-            cost=Decimal(5.1),
-            time_minutes=5,
-            user=self.user
-        )
-        r1.tags.add(tag1)
-        r2 = Recipe.objects.create(
-            title="Eggs Florentine",
-            cost=Decimal(10.9),
-            time_minutes=15,
-            user=self.user
-        )
-        r2.tags.add(tag1)
-
-        res = self.client.get(TAGS_URL, {'assigned_only': 1})
+        r1, r2 = Recipe.objects.bulk_create([
+            Recipe(
+                title="Ham and Eggs",
+                cost=Decimal('5.1'),
+                time_minutes=5,
+                user=self.user
+            ),
+            Recipe(
+                title="Eggs Florentine",
+                cost=Decimal('10.9'),
+                time_minutes=15,
+                user=self.user
+            ),
+        ])
+        RecipeTag = Recipe.tags.through
+        RecipeTag.objects.bulk_create([
+            RecipeTag(recipe=r1, tag=tag1),
+            RecipeTag(recipe=r2, tag=tag1),
+        ])
+
+        with self.assertNumQueries(1):
+            res = list_tags(self.user, {'assigned_only': 1})
 
         self.assertEqual(len(res.data), 1)
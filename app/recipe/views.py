@@ -1,6 +1,7 @@
 """
 View for the recipe APIs.
 """
+from django.db.models import Exists, OuterRef
 from drf_spectacular.utils import (
     extend_schema_view,
     extend_schema,
@@ -113,6 +114,7 @@ class BaseRecipeAttrViewSet(mixins.UpdateModelMixin,
                             mixins.ListModelMixin,
                             viewsets.GenericViewSet):
     """Base viewset for recipe attributes."""
+    recipe_field = None
     authentication_classes = [TokenAuthentication]
     permission_classes = [IsAuthenticated]
 
@@ -123,20 +125,25 @@ class BaseRecipeAttrViewSet(mixins.UpdateModelMixin,
         )
         queryset = self.queryset
         if assigned_only:
-            queryset = queryset.filter(recipe__isnull=False)
+            recipes = Recipe.objects.filter(
+                **{self.recipe_field: OuterRef('pk')}
+            )
+            queryset = queryset.filter(Exists(recipes))
 
         return queryset.filter(
             user=self.request.user
-        ).order_by("-name").distinct()
+        ).order_by("-name")
 
 
 class TagViewSet(BaseRecipeAttrViewSet):
     """Manage tags in the database."""
     serializer_class = serializers.TagSerializer
     queryset = Tag.objects.all()
+    recipe_field = 'tags'
 
 
 class IngredientViewSet(BaseRecipeAttrViewSet):
     """Manage ingredients in the database."""
     serializer_class = serializers.IngredientSerializer
     queryset = Ingredient.objects.all()
+    recipe_field = 'ingredients'
@@ -2,7 +2,7 @@
 Tests for the User api
 """
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework.test import APIClient
@@ -19,6 +19,9 @@ def create_user(**params):
     return get_user_model().objects.create_user(**params)
 
 
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+)
 class PublicUserApiTests(TestCase):
     """Test the public features of the user api"""
 
@@ -117,15 +120,21 @@ class PublicUserApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+)
 class PrivateUserApiTests(TestCase):
     """Test API requests that require authentication."""
 
-    def setUp(self):
-        self.user = create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email='test@example.com',
             password='testpass123',
             name='Test Name',
         )
+
+    def setUp(self):
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 